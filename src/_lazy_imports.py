@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+
+def lazy_import(namespace: dict[str, Any], lazy_modules: dict[str, str], name: str) -> Any:
+    """
+    Returnează o dependență importată leneș (PEP 562) pentru modulul care deține `namespace`.
+
+    Fiecare modul o expune prin propriul hook:
+    `def __getattr__(name): return lazy_import(globals(), _LAZY_MODULES, name)`.
+
+    Parametri:
+    - namespace (dict[str, Any]): `globals()` al modulului apelant.
+    - lazy_modules (dict[str, str]): Alias -> numele modulului de importat (ex: {"pd": "pandas"}).
+    - name (str): Aliasul cerut.
+
+    Ce se întâmplă în interior:
+    - Dacă aliasul a fost deja rezolvat, îl returnează din `namespace`.
+    - Altfel importă modulul; dacă lipsește (ImportError), folosește None.
+    - Salvează rezultatul în `namespace`, astfel încât accesările următoare nu mai trec prin hook.
+
+    Ieșire:
+    - Modulul importat sau None; AttributeError pentru alias necunoscut.
+    """
+    if name in namespace:
+        return namespace[name]
+    module_name = lazy_modules.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {namespace['__name__']!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(module_name)
+    except ImportError:
+        module = None
+    namespace[name] = module
+    return module
@@ -1,11 +1,14 @@
 from __future__ import annotations
 from typing import Any, Optional
+import asyncio
 import json
 import logging
 import requests
 import requests_cache
 from retry_requests import retry
 import openmeteo_requests
+from openmeteo_requests import OpenMeteoRequestsError
+from openmeteo_sdk.WeatherApiResponse import WeatherApiResponse
 
 
 class ApiRequest:
@@ -15,16 +18,17 @@ class ApiRequest:
     Atribute:
     - latitude (float): Latitudinea locației țintă.
     - longitude (float): Longitudinea locației țintă.
-    - session (requests.Session): Sesiune HTTP reutilizabilă pentru cereri generice.
-    - cache_session (requests_cache.CachedSession): Sesiune cu cache pentru a reduce traficul.
+    - cache_session (requests_cache.CachedSession): Sesiune cu cache (sqlite) care respectă
+      antetele Cache-Control/Expires ale serverului, pentru a reduce traficul.
     - retry_session: Sesiune cu mecanism de retry (reîncercare) pentru robustețe.
     - openmeteo (openmeteo_requests.Client): Client Open-Meteo ce folosește sesiunea cu retry.
 
     Utilizare tipică:
     1) Instanțiere cu lat/lon.
     2) Apelul `fetch` pentru endpoint-uri arbitrare (JSON).
-    3) Apelul `fetch_openmeteo` pentru API-ul Open-Meteo cu parametri orari.
-    4) Apelul `close` pentru a închide sesiunea.
+    3) Apelul `fetch_openmeteo` pentru API-ul Open-Meteo cu parametri orari, sau
+       `fetch_many_openmeteo` (async) pentru mai multe interogări în paralel.
+    4) Apelul `close` pentru a închide sesiunea cu cache.
     """
 
     def __init__(self, latitude: float, longitude: float) -> None:
@@ -36,8 +40,8 @@ class ApiRequest:
         - longitude: Longitudinea locației, în grade zecimale.
 
         Ce se întâmplă în interior:
-        - Creează o sesiune `requests.Session`.
-        - Configurează o sesiune cu cache (expiră după 3600s).
+        - Configurează o sesiune cu cache sqlite doar pentru GET, care respectă `Cache-Control`
+          (max-age) și `Expires` din răspuns; implicit expiră după 3600s.
         - Configurează mecanismul de retry pentru cereri.
         - Creează clientul Open-Meteo care folosește sesiunea cu retry.
 
@@ -46,9 +50,14 @@ class ApiRequest:
         """
         self.latitude = latitude
         self.longitude = longitude
-        self.session = requests.Session()
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.cache_session = requests_cache.CachedSession('.cache', expire_after=3600)
+        self.cache_session = requests_cache.CachedSession(
+            '.cache',
+            backend='sqlite',
+            cache_control=True,
+            expire_after=3600,
+            allowable_methods=('GET',),
+        )
         self.retry_session = retry(self.cache_session, retries=5, backoff_factor=0.2)
         self.openmeteo = openmeteo_requests.Client(session=self.retry_session)
 
@@ -73,7 +82,8 @@ class ApiRequest:
         Ce se întâmplă în interior:
         - Construiește dicționarul final de parametri, adăugând `latitude` și
           `longitude` dacă lipsesc.
-        - Trimite cererea cu `requests.Session.get` și verifică statusul.
+        - Trimite cererea prin sesiunea cu cache și retry și verifică statusul; corpul
+          răspunsului poate fi servit din cache-ul sqlite.
         - Încearcă să parseze răspunsul ca JSON; dacă eșuează, îl parsează manual
           din text.
         - Loghează erorile și propagă excepțiile relevante.
@@ -88,7 +98,7 @@ class ApiRequest:
             final_params = params.copy() if params else {}
             final_params.setdefault("latitude", self.latitude)
             final_params.setdefault("longitude", self.longitude)
-            resp = self.session.get(endpoint, params=final_params, timeout=timeout, headers=headers)
+            resp = self.retry_session.get(endpoint, params=final_params, timeout=timeout, headers=headers)
             resp.raise_for_status()
 
             try:
@@ -143,22 +153,126 @@ class ApiRequest:
         responses = self.openmeteo.weather_api(url, params=params)
         return responses
 
+    async def fetch_many_openmeteo(
+        self,
+        *,
+        url: str,
+        queries: list[dict[str, Any]],
+        timeout: int = 10,
+    ) -> list[list[WeatherApiResponse]]:
+        """
+        Trimite concurent mai multe interogări Open-Meteo și returnează răspunsurile decodate.
+
+        Parametri (keyword-only):
+        - url (str): Endpoint-ul Open-Meteo.
+        - queries (list[dict]): Câte un dicționar de parametri per interogare (ex: hourly,
+          start_date, end_date). Latitudinea și longitudinea sunt adăugate implicit dacă lipsesc.
+        - timeout (int): Timpul maxim de așteptare per cerere (secunde). Implicit 10s.
+
+        Ce se întâmplă în interior:
+        - Deschide un singur `httpx.AsyncClient` și lansează toate cererile cu `asyncio.gather`,
+          astfel încât timpul total este dat de cea mai lentă cerere, nu de suma lor.
+        - Așteaptă toate cererile (`return_exceptions=True`) înainte de a închide clientul și
+          abia apoi ridică prima eroare, fără task-uri rămase în zbor.
+        - Importă `httpx` doar aici, pentru a nu încărca modulul la importul clasei.
+        - Pentru status 400/429 ridică `OpenMeteoRequestsError` cu motivul (`reason`) din corpul
+          JSON, la fel ca clientul sincron; pentru alte erori HTTP, `raise_for_status`.
+        - Cere formatul `flatbuffers` și decodează fiecare corp de răspuns direct cu
+          `WeatherApiResponse.GetRootAs`, la fel ca clientul `openmeteo_requests`.
+        - Nu trece prin sesiunea cu cache/retry; este destinat interogărilor multiple, noi.
+
+        Ieșire:
+        - list[list[WeatherApiResponse]]: Pentru fiecare interogare (în aceeași ordine), lista
+          de răspunsuri decodate.
+        """
+        import httpx
+
+        requests_params: list[dict[str, Any]] = []
+        for query in queries:
+            params = dict(query)
+            params.setdefault("latitude", self.latitude)
+            params.setdefault("longitude", self.longitude)
+            params["format"] = "flatbuffers"
+            requests_params.append(params)
+
+        try:
+            async with httpx.AsyncClient(timeout=timeout) as client:
+                responses = await asyncio.gather(
+                    *(client.get(url, params=params) for params in requests_params),
+                    return_exceptions=True,
+                )
+            # Toate cererile s-au încheiat înainte de închiderea clientului; prima eroare se propagă aici.
+            for resp in responses:
+                if isinstance(resp, BaseException):
+                    raise resp
+            results: list[list[WeatherApiResponse]] = []
+            for resp in responses:
+                if resp.status_code in (400, 429):
+                    try:
+                        body = resp.json()
+                    except ValueError:
+                        body = {"reason": resp.text}
+                    reason = body.get("reason", body) if isinstance(body, dict) else body
+                    raise OpenMeteoRequestsError(reason)
+                resp.raise_for_status()
+                results.append(self._decode_openmeteo(resp.content))
+            return results
+        except httpx.HTTPError as he:
+            self.logger.error("Request error: %s", he)
+            raise
+        except Exception as e:
+            self.logger.error("Unexpected error: %s", e)
+            raise
+
+    @staticmethod
+    def _decode_openmeteo(data: bytes) -> list[WeatherApiResponse]:
+        """
+        Decodează un corp de răspuns Open-Meteo în format flatbuffers.
+
+        Parametri:
+        - data (bytes): Corpul brut al răspunsului HTTP.
+
+        Ce se întâmplă în interior:
+        - Corpul conține mesaje consecutive, fiecare precedat de lungimea sa (4 octeți,
+          little-endian); fiecare mesaj este citit cu `WeatherApiResponse.GetRootAs`.
+        - Un mesaj de eroare în flux începe cu textul "Unexpected" (lungimea citită este
+          0x78656E55); în acest caz se ridică `OpenMeteoRequestsError` cu textul erorii.
+        - Dacă lungimea unui mesaj depășește datele rămase, corpul nu este flatbuffers valid
+          (ex. JSON) și se ridică `OpenMeteoRequestsError`, în loc să se decodeze date invalide.
+
+        Ieșire:
+        - list[WeatherApiResponse]: Mesajele decodate, în ordine.
+        """
+        messages: list[WeatherApiResponse] = []
+        total = len(data)
+        pos = 0
+        while pos < total:
+            length = int.from_bytes(data[pos:pos + 4], byteorder="little")
+            if length == 0x78656E55:
+                raise OpenMeteoRequestsError(data[pos:].decode("utf-8", errors="replace"))
+            if pos + 4 + length > total:
+                raise OpenMeteoRequestsError("Invalid Open-Meteo response: not a flatbuffers payload")
+            messages.append(WeatherApiResponse.GetRootAs(data, pos + 4))
+            pos += length + 4
+        return messages
+
     def close(self) -> None:
         """
-        Închide sesiunea HTTP internă pentru a elibera resursele.
+        Închide sesiunea HTTP cu cache (și backend-ul sqlite) pentru a elibera resursele.
 
         Parametri:
         - None
 
         Ce se întâmplă în interior:
-        - Apelează `self.session.close()` într-un bloc try/except pentru a evita
+        - Apelează `self.cache_session.close()` (aceeași sesiune folosită de `retry_session`
+          și de clientul Open-Meteo) într-un bloc try/except pentru a evita
           propagarea excepțiilor necritice.
 
         Ieșire:
         - None
         """
         try:
-            self.session.close()
+            self.cache_session.close()
         except Exception:
             pass
 
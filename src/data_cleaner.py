@@ -1,13 +1,23 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Optional
 
-try:
+from src._lazy_imports import lazy_import
+
+if TYPE_CHECKING:
     import pandas as pd
-    import numpy as np
-except Exception:
-    pd = None
-    np = None
+
+# Dependențe opționale, importate leneș (PEP 562) la primul acces, nu la încărcarea modulului.
+_LAZY_MODULES = {"np": "numpy", "pd": "pandas"}
+_LEADING = frozenset(("date", "hour", "latitude", "longitude", "time"))
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_import(globals(), _LAZY_MODULES, name)
+
+
+_lazy = __getattr__
 
 
 class DataCleaner:
@@ -54,86 +64,75 @@ class DataCleaner:
         Ieșire:
         - Obiectul curățat: `pd.DataFrame`, `list[dict]` sau orice alt tip inițial.
         """
+        pd = _lazy("pd")
         if pd is not None and isinstance(self.raw_data, pd.DataFrame):
             return self._clean_dataframe(self.raw_data)
         if isinstance(self.raw_data, list) and (len(self.raw_data) == 0 or isinstance(self.raw_data[0], dict)):
             return self._clean_rows(self.raw_data)
         return self.raw_data
 
-    def _measurement_columns(self, columns: Sequence[str]) -> list[str]:
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _measurement_columns(columns: tuple[str, ...]) -> tuple[str, ...]:
         """
         Identifică coloanele de măsurători, excluzând metadatele standard.
 
         Parametri:
-        - columns (Sequence[str]): Lista tuturor numelor de coloane.
+        - columns (tuple[str, ...]): Numele tuturor coloanelor (tuple, pentru a putea fi cheie de cache).
 
         Ce se întâmplă în interior:
-        - Elimină din listă câmpurile meta: date, hour, latitude, longitude, time.
+        - Elimină câmpurile meta din `_LEADING`: date, hour, latitude, longitude, time.
+        - Rezultatul este memorat cu `lru_cache`, deci apelurile repetate cu aceleași coloane
+          nu mai reconstruiesc lista.
 
         Ieșire:
-        - list[str]: Numai coloanele de măsurători.
+        - tuple[str, ...]: Numai coloanele de măsurători.
         """
-        leading = {"date", "hour", "latitude", "longitude", "time"}
-        return [c for c in columns if c not in leading]
+        return tuple(c for c in columns if c not in _LEADING)
 
-    def _clean_dataframe(self, df: 'pd.DataFrame') -> 'pd.DataFrame':
+    def _clean_dataframe(self, df: 'pd.DataFrame', *, inplace: bool = False) -> 'pd.DataFrame':
         """
         Aplică pașii de curățare pe un DataFrame.
 
         Parametri:
         - df (pd.DataFrame): Tabelul inițial.
+        - inplace (bool, keyword-only): Dacă este True, modifică direct `df` (util când apelantul
+          deține tabelul, ex. `_clean_rows`). Implicit False.
 
         Ce se întâmplă în interior:
         - Identifică coloanele de măsurători.
-        - Elimină rândurile unde toate măsurile sunt NaN.
-        - Convertește măsurile la numeric (coerce -> NaN pentru valori invalide).
-        - Umple NaN cu 0 pentru măsurători.
-        - Normalizează `latitude` și `longitude` la numeric cu NaN -> 0.
-        - Resetează indexul.
+        - Convertește măsurile și `latitude`/`longitude` la numeric într-o singură trecere
+          (coerce -> NaN pentru valori invalide), obținând un bloc 2D float32 contiguu.
+        - Calculează masca rândurilor de păstrat cu `np.isnan(...).all(axis=1)` pe coloanele de
+          măsurători (o singură trecere vectorizată); rândurile complet NaN după conversie sunt eliminate.
+        - Fără `inplace`, rândurile păstrate sunt selectate cu `take`, care produce singura copie
+          a tabelului (fără `df.copy()` în plus).
+        - Înlocuiește NaN cu 0 direct în bloc și îl scrie înapoi o singură dată.
+        - Resetează indexul pe loc.
 
         Ieșire:
-        - pd.DataFrame: Copia curățată a tabelului.
+        - pd.DataFrame: Tabelul curățat (o copie, sau chiar `df` dacă `inplace=True`).
         """
-        cols = self._measurement_columns(df.columns.tolist())
+        cols = list(self._measurement_columns(tuple(df.columns)))
         if not cols:
-            return df.copy()
-        cleaned = df.copy()
-        cleaned = cleaned.dropna(subset=cols, how="all")
-        for c in cols:
-            cleaned[c] = pd.to_numeric(cleaned[c], errors="coerce")
-        cleaned[cols] = cleaned[cols].fillna(0)
-        if "latitude" in cleaned:
-            cleaned["latitude"] = pd.to_numeric(cleaned["latitude"], errors="coerce").fillna(0)
-        if "longitude" in cleaned:
-            cleaned["longitude"] = pd.to_numeric(cleaned["longitude"], errors="coerce").fillna(0)
-        return cleaned.reset_index(drop=True)
-
-    def _is_nan_like(self, v: Any) -> bool:
-        """
-        Testează dacă o valoare este echivalentă cu NaN.
-
-        Parametri:
-        - v (Any): Valoarea de testat.
-
-        Ce se întâmplă în interior:
-        - Verifică None.
-        - Dacă numpy este disponibil, încearcă `np.isnan` pe valoare.
-        - Fallback: folosește proprietatea NaN != NaN pentru a detecta NaN.
-
-        Ieșire:
-        - bool: True dacă valoarea este None/NaN, False altfel.
-        """
-        if v is None:
-            return True
-        if np is not None:
-            try:
-                return bool(np.isnan(v))
-            except Exception:
-                return False
-        try:
-            return v != v
-        except Exception:
-            return False
+            return df if inplace else df.copy()
+        pd, np = _lazy("pd"), _lazy("np")
+        numeric = cols + [c for c in ("latitude", "longitude") if c in df]
+        block = df[numeric].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float32)
+        keep = ~np.isnan(block[:, :len(cols)]).all(axis=1)
+        block = block[keep]
+        block[np.isnan(block)] = 0.0
+        if inplace:
+            df.reset_index(drop=True, inplace=True)
+            df.drop(index=np.flatnonzero(~keep), inplace=True)
+            cleaned = df
+        else:
+            # `take` returnează o copie proprie (fără legătură „slice” cu `df`), deci coloanele
+            # pot fi rescrise fără SettingWithCopyWarning.
+            cleaned = df.take(np.flatnonzero(keep))
+        cleaned.reset_index(drop=True, inplace=True)
+        cleaned[numeric] = block
+        return cleaned
 
     def _clean_rows(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """
@@ -144,9 +143,15 @@ class DataCleaner:
 
         Ce se întâmplă în interior:
         - Dacă lista e goală, o returnează.
-        - Identifică cheile de măsurători.
-        - Filtrează rândurile unde toate măsurile sunt NaN-like.
-        - Convertește valorile măsurate la float, invalide -> NaN -> 0.
+        - Identifică cheile de măsurători din primul rând; dacă nu există, returnează copii
+          nemodificate ale rândurilor (ca `_clean_dataframe`).
+        - Dacă pandas este disponibil și toate rândurile au aceleași chei ca primul, construiește
+          o singură dată un DataFrame cu coloanele primului rând, îl curăță vectorizat cu
+          `_clean_dataframe` și îl convertește înapoi în dict-uri.
+        - Altfel (fără pandas sau rânduri cu chei diferite), parcurge rândurile în Python,
+          într-o singură trecere; cheile în plus din alte rânduri rămân neatinse:
+        - Convertește valorile măsurate la float (invalide -> NaN -> 0) și sare peste rândurile
+          unde toate măsurile sunt NaN după conversie, ca în `_clean_dataframe`.
         - Normalizează `latitude` și `longitude` la float cu fallback 0.
 
         Ieșire:
@@ -154,24 +159,34 @@ class DataCleaner:
         """
         if not rows:
             return rows
-        keys = list(rows[0].keys())
-        measure_keys = self._measurement_columns(keys)
-        def all_measures_nan(r: dict[str, Any]) -> bool:
-            return all(self._is_nan_like(r.get(k)) for k in measure_keys)
+        measure_keys = self._measurement_columns(tuple(rows[0]))
+        if not measure_keys:
+            return [dict(r) for r in rows]
+        pd = _lazy("pd")
+        first_keys = rows[0].keys()
+        if pd is not None and all(r.keys() == first_keys for r in rows):
+            df = pd.DataFrame.from_records(rows, columns=list(first_keys))
+            return self._clean_dataframe(df, inplace=True).to_dict("records")
         cleaned: list[dict[str, Any]] = []
         for r in rows:
-            if all_measures_nan(r):
-                continue
             new_r = dict(r)
+            any_valid = False
             for k in measure_keys:
                 v = new_r.get(k)
+                if v is None:
+                    new_r[k] = 0.0
+                    continue
                 try:
-                    fv = float(v) if v is not None else float('nan')
+                    fv = float(v)
                 except Exception:
                     fv = float('nan')
                 if fv != fv:
                     fv = 0.0
+                else:
+                    any_valid = True
                 new_r[k] = fv
+            if not any_valid:
+                continue
             for k in ("latitude", "longitude"):
                 if k in new_r:
                     try:
@@ -1,4 +1,4 @@
-import sys
+import argparse
 
 from src.api_request import ApiRequest
 from src.openmeteo_parser import OpenMeteoParser
@@ -7,16 +7,36 @@ from src.preview_data import PreviewData
 from src.graph_enum import GraphType
 
 
+def _non_negative_int(value: str) -> int:
+    """
+    Tip argparse pentru `--preview`: acceptă doar întregi >= 0.
+
+    Parametri:
+    - value (str): Valoarea primită din linia de comandă.
+
+    Ieșire:
+    - int: Valoarea convertită; altfel ridică `argparse.ArgumentTypeError`.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {number}")
+    return number
+
+
 def main() -> None:
     """
     Punctul de intrare al aplicației care interoghează Open-Meteo, parsează și curăță datele.
 
     Intrări:
     - Argumente linie de comandă (opționale):
-      * sys.argv[1]: latitude (float)
-      * sys.argv[2]: longitude (float)
-      * sys.argv[3]: start_date (YYYY-MM-DD)
-      * sys.argv[4]: end_date (YYYY-MM-DD)
+      * latitude (float)
+      * longitude (float)
+      * start_date (YYYY-MM-DD)
+      * end_date (YYYY-MM-DD)
+      * --preview N: numărul de rânduri afișate în previzualizare (implicit 10).
 
     Ce se întâmplă în interior:
     - Citește argumentele; dacă lat/lon nu sunt valide, folosește valorile implicite.
@@ -27,7 +47,7 @@ def main() -> None:
     - Curăță datele cu `DataCleaner`.
 
     Ieșire:
-    - Prin print: previzualizarea datelor parsate și rezultatul curățării.
+    - Prin print: primele N rânduri din datele parsate (nu întregul set) și rezultatul curățării.
     - Return: None.
     """
     lat: float = 47.0269
@@ -35,18 +55,26 @@ def main() -> None:
     start_date: str = "2015-12-01"
     end_date: str = "2025-12-01"
 
-    if len(sys.argv) >= 3:
+    arg_parser = argparse.ArgumentParser(description="Fetch, parse and clean Open-Meteo hourly data.")
+    arg_parser.add_argument("latitude", nargs="?")
+    arg_parser.add_argument("longitude", nargs="?")
+    arg_parser.add_argument("start_date", nargs="?", help="YYYY-MM-DD")
+    arg_parser.add_argument("end_date", nargs="?", help="YYYY-MM-DD")
+    arg_parser.add_argument("--preview", type=_non_negative_int, default=10, help="rows to print from the parsed data")
+    args = arg_parser.parse_args()
+
+    if args.latitude is not None and args.longitude is not None:
         try:
-            lat = float(sys.argv[1])
-            lon = float(sys.argv[2])
+            lat = float(args.latitude)
+            lon = float(args.longitude)
         except ValueError:
             print("[WARN] Invalid latitude/longitude arguments. Using defaults.")
 
     # Optional date range as YYYY-MM-DD; if provided, they will be passed to the API
-    if len(sys.argv) >= 4:
-        start_date = sys.argv[3]
-    if len(sys.argv) >= 5:
-        end_date = sys.argv[4]
+    if args.start_date:
+        start_date = args.start_date
+    if args.end_date:
+        end_date = args.end_date
 
     requester = ApiRequest(latitude=lat, longitude=lon)
 
@@ -91,14 +119,14 @@ def main() -> None:
     try:
         df = parser.to_dataframe(hourly_keys)
         print("=== PARSED (TABULAR DataFrame) PREVIEW ===")
-        print(df)
+        print(df.head(args.preview).to_string())
         print(f"Rows: {len(df)}, Columns: {list(df.columns)}")
         cleaner = DataCleaner(raw_data=df)
     except Exception:
         print("[INFO] pandas not available. Falling back to list-of-rows output.")
         rows = parser.to_rows(hourly_keys)
         print("=== PARSED (ROWS) PREVIEW ===")
-        print(rows[:3])
+        print(rows[:args.preview])
         cleaner = DataCleaner(raw_data=rows)
 
     cleaned = cleaner.clean()
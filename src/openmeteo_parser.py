@@ -1,11 +1,53 @@
 from __future__ import annotations
 
-from typing import Sequence, List, Dict, Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Sequence, List, Dict, Any
 
-try:
-    import pandas as pd
-except Exception:
-    pd = None
+from src._lazy_imports import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# numpy/pandas sunt importate leneș (PEP 562) la primul acces, nu la încărcarea modulului.
+_LAZY_MODULES = {"np": "numpy", "pd": "pandas"}
+
+
+def __getattr__(name: str) -> Any:
+    return lazy_import(globals(), _LAZY_MODULES, name)
+
+
+_lazy = __getattr__
+
+
+@lru_cache(maxsize=16)
+def _make_builder(hourly_keys: tuple[str, ...]) -> Callable[..., List[Dict[str, Any]]]:
+    """
+    Generează (și memorează) o funcție specializată care construiește rândurile pentru un set fix de chei.
+
+    Parametri:
+    - hourly_keys (tuple[str, ...]): Numele variabilelor orare, în ordine (tuple, pentru cache).
+
+    Ce se întâmplă în interior:
+    - Scrie sursa unei funcții `build(times, latv, lonv, v0, v1, ...)` în care dict-ul fiecărui rând
+      este un literal cu toate cheile fixate (hour = None, lat/lon constante), fără bucle interne pe chei.
+    - Compilează sursa cu `exec`; rezultatul este memorat cu `lru_cache` per tuple de chei.
+
+    Ieșire:
+    - Callable: Funcția `build`, care primește listele de valori și returnează lista de rânduri.
+    """
+    names = [f"v{i}" for i in range(len(hourly_keys))]
+    fields = "".join(f", {key!r}: {name}" for key, name in zip(hourly_keys, names))
+    params = "".join(f", {name}" for name in names)
+    # Virgula finală face despachetarea corectă și pentru zero chei (`for t, in zip(times)`).
+    targets = ", ".join(["t", *names]) + ","
+    source = (
+        f"def build(times, latv, lonv{params}):\n"
+        f"    return [{{'date': t, 'hour': None, 'latitude': latv, 'longitude': lonv{fields}}}\n"
+        f"            for {targets} in zip(times{params})]\n"
+    )
+    namespace: Dict[str, Any] = {}
+    exec(source, namespace)
+    return namespace["build"]
 
 
 class OpenMeteoParser:
@@ -17,7 +59,8 @@ class OpenMeteoParser:
 
     Flux tipic:
     1) Instanțiere cu răspunsul brut.
-    2) Apelul `to_rows` pentru o listă de dict-uri (independent de pandas).
+    2) Apelul `to_columns` pentru un dict de coloane numpy (independent de pandas), sau
+       `to_rows` pentru o listă de dict-uri construită din acestea.
     3) Apelul `to_dataframe` pentru un DataFrame pandas (dacă pandas este instalat).
     """
     def __init__(self, response) -> None:
@@ -54,44 +97,90 @@ class OpenMeteoParser:
         interval = hourly.Interval()
         return start, end, interval
 
-    def to_rows(self, hourly_keys: Sequence[str]) -> List[Dict[str, Any]]:
+    def _time_and_values(self, hourly_keys: Sequence[str]) -> tuple[np.ndarray, List[np.ndarray]]:
         """
-        Convertește datele orare într-o listă de rânduri (dict-uri) cu câmpuri cheie.
+        Construiește timestamp-urile și vectorii de valori, tăiați la lungimea comună.
 
         Parametri:
         - hourly_keys (Sequence[str]): Numele variabilelor orare de extras (în ordinea variabilelor din răspuns).
 
         Ce se întâmplă în interior:
         - Obține obiectul `Hourly()` și indexul temporal (start, end, interval).
-        - Construiește lista de timestamp-uri (epoch sec) cu `range`.
-        - Preia valorile variabilelor ca numpy arrays folosind `Variables(i).ValuesAsNumpy()`.
-        - Calculează minimul m al lungimilor pentru a evita out-of-range.
-        - Construiește rândurile cu chei standard: date (epoch sec), hour (None), latitude, longitude, plus variabilele cerute.
+        - Construiește vectorul de timestamp-uri (epoch sec) cu `np.arange`.
+        - Preia valorile variabilelor ca numpy arrays float32 folosind `Variables(i).ValuesAsNumpy()`.
+        - Calculează minimul m al lungimilor pentru a evita out-of-range și taie toți vectorii la m.
 
         Ieșire:
-        - List[Dict[str, Any]]: Fiecare dict reprezintă un moment orar cu valorile variabilelor.
+        - Tuple (times: np.ndarray[int64], values: List[np.ndarray[float32]]), toate de lungime m.
         """
-        r = self.response
-        hourly = r.Hourly()
+        np = _lazy("np")
+        hourly = self.response.Hourly()
         start, end, interval = self._time_index()
         # Build timestamps in seconds
-        times = list(range(start, end, interval))
-        rows: List[Dict[str, Any]] = []
+        times = np.arange(start, end, interval, dtype=np.int64)
         # Pre-fetch values arrays
-        values_series = [hourly.Variables(i).ValuesAsNumpy() for i in range(len(hourly_keys))]
+        values_series = [
+            hourly.Variables(i).ValuesAsNumpy().astype(np.float32, copy=False)
+            for i in range(len(hourly_keys))
+        ]
         m = min(len(times), *[len(v) for v in values_series]) if values_series else len(times)
-        for idx in range(m):
-            ts = times[idx]
-            row: Dict[str, Any] = {
-                "date": ts,
-                "hour": None,
-                "latitude": r.Latitude(),
-                "longitude": r.Longitude(),
-            }
-            for i, key in enumerate(hourly_keys):
-                row[key] = values_series[i][idx]
-            rows.append(row)
-        return rows
+        return times[:m], [values[:m] for values in values_series]
+
+    def to_columns(self, hourly_keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Convertește datele orare într-un dict de coloane (numpy arrays), fără a construi rânduri.
+
+        Parametri:
+        - hourly_keys (Sequence[str]): Numele variabilelor orare de extras (în ordinea variabilelor din răspuns).
+
+        Ce se întâmplă în interior:
+        - Obține timestamp-urile și valorile (tăiate la lungimea comună m) cu `_time_and_values`.
+        - Adaugă coloanele standard: date (epoch sec), hour (None), latitude, longitude (constante).
+
+        Ieșire:
+        - Dict[str, np.ndarray]: Coloanele [date, hour, latitude, longitude, <metrice>], toate de lungime m.
+        """
+        np = _lazy("np")
+        r = self.response
+        times, values_series = self._time_and_values(hourly_keys)
+        m = len(times)
+        columns: Dict[str, np.ndarray] = {
+            "date": times,
+            "hour": np.full(m, None, dtype=object),
+            "latitude": np.full(m, r.Latitude(), dtype=np.float32),
+            "longitude": np.full(m, r.Longitude(), dtype=np.float32),
+        }
+        for key, values in zip(hourly_keys, values_series):
+            columns[key] = values
+        return columns
+
+    def to_rows(self, hourly_keys: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        Convertește datele orare într-o listă de rânduri (dict-uri) cu câmpuri cheie.
+
+        Parametri:
+        - hourly_keys (Sequence[str]): Numele variabilelor orare de extras (în ordinea variabilelor din răspuns).
+
+        Ce se întâmplă în interior:
+        - Obține doar timestamp-urile și valorile cu `_time_and_values` (fără coloanele constante
+          hour/latitude/longitude, care devin scalari în funcția specializată).
+        - Convertește fiecare vector o singură dată în listă Python (`tolist`).
+        - Construiește rândurile cu funcția specializată pentru aceste chei (`_make_builder`),
+          generată o singură dată per tuple de chei.
+
+        Ieșire:
+        - List[Dict[str, Any]]: Fiecare dict reprezintă un moment orar cu valorile variabilelor.
+        """
+        np = _lazy("np")
+        keys = tuple(hourly_keys)
+        times, values_series = self._time_and_values(keys)
+        build = _make_builder(keys)
+        return build(
+            times.tolist(),
+            np.float32(self.response.Latitude()).item(),
+            np.float32(self.response.Longitude()).item(),
+            *(values.tolist() for values in values_series),
+        )
 
     def to_dataframe(self, hourly_keys: Sequence[str]):
         """
@@ -103,16 +192,18 @@ class OpenMeteoParser:
         Ce se întâmplă în interior:
         - Validează că `pandas` este disponibil; altfel ridică eroare cu instrucțiunea de fallback.
         - Construiește indexul temporal folosind epoch sec -> UTC (date_range cu freq în secunde).
-        - Creează DataFrame inițial cu coloana `time`.
-        - Pentru fiecare cheie orară, inserează vectorul de valori; dacă dimensiunile nu coincid,
-          ajustează tăind la minimul comun.
-        - Adaugă lat/long constante pe toate rândurile.
-        - Derivă coloanele `date` (YYYY-MM-DD) și `hour` (HH:MM) din `time`.
+        - Preia toți vectorii de valori (ca float32), calculează o singură dată minimul comun m al lungimilor
+          și taie indexul și valorile la m.
+        - Creează DataFrame-ul dintr-un singur dict de coloane (o singură alocare).
+        - Adaugă lat/long constante (float32) pe toate rândurile.
+        - Derivă coloanele `date` (ziua, ca datetime64 la miezul nopții UTC) și `hour` (int16 în
+          format HHMM, ex. 1330) din `time`, vectorizat, fără formatare `strftime` pe fiecare rând.
         - Reordonare coloane astfel încât să fie: [date, hour, latitude, longitude, <metrice>].
 
         Ieșire:
         - pandas.DataFrame: Tabelul final cu variabilele cerute și informația temporală/geografică.
         """
+        pd, np = _lazy("pd"), _lazy("np")
         if pd is None:
             raise RuntimeError("pandas is not installed; use to_rows() instead.")
         r = self.response
@@ -124,19 +215,20 @@ class OpenMeteoParser:
             freq=pd.Timedelta(seconds=hourly.Interval()),
             inclusive="left",
         )
-        df = pd.DataFrame({"time": date_index})
-        # Add variables
-        for i, key in enumerate(hourly_keys):
-            values = hourly.Variables(i).ValuesAsNumpy()
-            if len(values) != len(df):
-                m = min(len(values), len(df))
-                df = df.iloc[:m].reset_index(drop=True)
-                values = values[:m]
-            df[key] = values
-        df["latitude"] = r.Latitude()
-        df["longitude"] = r.Longitude()
-        df["date"] = df["time"].dt.strftime("%Y-%m-%d")
-        df["hour"] = df["time"].dt.strftime("%H:%M")
+        values_list = [
+            hourly.Variables(i).ValuesAsNumpy().astype(np.float32, copy=False)
+            for i in range(len(hourly_keys))
+        ]
+        m = min(len(date_index), *[len(v) for v in values_list]) if values_list else len(date_index)
+        data: Dict[str, Any] = {"time": date_index[:m]}
+        for key, values in zip(hourly_keys, values_list):
+            data[key] = values[:m]
+        df = pd.DataFrame(data, copy=False)
+        df["latitude"] = np.float32(r.Latitude())
+        df["longitude"] = np.float32(r.Longitude())
+        time = df["time"].dt
+        df["date"] = time.normalize()
+        df["hour"] = (time.hour * 100 + time.minute).astype(np.int16)
         leading = ["date", "hour", "latitude", "longitude"]
         metrics = [c for c in df.columns if c not in set(leading + ["time"])]
         return df[leading + metrics]
@@ -1,6 +1,4 @@
 from src.graph_enum import GraphType
-import pandas as pd
-import matplotlib.pyplot as plt
 
 
 class PreviewData:
@@ -21,6 +19,9 @@ class PreviewData:
         return None
 
     def _draw_linear(self, data, x_columns, y_columns):
+        import pandas as pd
+        import matplotlib.pyplot as plt
+
         print("hello")
         df = pd.DataFrame(data)
         plt.figure(figsize=(10, 6))